@@ -5,7 +5,7 @@ A LangChain-powered system where multiple AI models discuss questions
 in a collaborative roundtable format.
 """
 
-from .roundtable import Roundtable, Discussion, Participant
+from .roundtable import Roundtable, Discussion, Participant, Contribution
 from .llm import get_llm_client, get_participant_models, get_moderator_llm
 
 __version__ = "0.1.0"
@@ -13,6 +13,7 @@ __all__ = [
     "Roundtable",
     "Discussion",
     "Participant",
+    "Contribution",
     "get_llm_client",
     "get_participant_models",
     "get_moderator_llm",
@@ -3,12 +3,25 @@ Command-line interface for Roundtable multi-agent discussions.
 """
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich import box
-from pathlib import Path
+from functools import lru_cache
+from typing import Optional
 
-console = Console()
+
+@lru_cache(maxsize=1)
+def _get_console():
+    """Get the shared rich console (rich is imported on first use)."""
+    from rich.console import Console
+    return Console()
+
+
+def _echo(message: str, style: Optional[str] = None, plain: bool = False) -> None:
+    """Print a status line, styled with rich unless plain output is wanted."""
+    if plain:
+        click.echo(message)
+    elif style:
+        _get_console().print(f"[{style}]{message}[/{style}]")
+    else:
+        _get_console().print(message)
 
 
 @click.group()
@@ -52,6 +65,9 @@ def discuss(question, rounds, temperature, no_moderator, tools, data, quiet, exp
     except ImportError:
         from roundtable import Roundtable
     
+    # Scripted runs (quiet, or exporting to a file) skip rich formatting
+    plain = quiet or bool(export and output)
+    
     try:
         # Initialize roundtable
         roundtable = Roundtable(
@@ -64,7 +80,6 @@ def discuss(question, rounds, temperature, no_moderator, tools, data, quiet, exp
         
         if not quiet:
             info_text = (
-                f"[bold cyan]Roundtable Discussion[/bold cyan]\n"
                 f"Rounds: {rounds} | Temperature: {temperature} | "
                 f"Participants: {len(roundtable.participants)}"
             )
@@ -73,27 +88,36 @@ def discuss(question, rounds, temperature, no_moderator, tools, data, quiet, exp
             if data:
                 info_text += f" | Data Files: {len(data)} path(s) 📁"
             
-            console.print(Panel(info_text, box=box.ROUNDED))
-        
-        # Conduct discussion
-        discussion = roundtable.discuss(question, verbose=not quiet)
+            if plain:
+                click.echo(f"Roundtable Discussion\n{info_text}")
+            else:
+                from rich import box
+                from rich.panel import Panel
+                _get_console().print(Panel(
+                    f"[bold cyan]Roundtable Discussion[/bold cyan]\n{info_text}",
+                    box=box.ROUNDED,
+                ))
         
-        # Export if requested
-        if export:
-            content = roundtable.export_discussion(discussion, format=export)
+        if export and output:
+            # Conduct discussion, streaming each round to the output file
+            with open(output, "w", encoding="utf-8") as fp:
+                roundtable.stream_export(question, fp, format=export, verbose=not quiet)
+            _echo(f"\n✓ Discussion exported to {output}", "green", plain)
+        else:
+            # Conduct discussion
+            discussion = roundtable.discuss(question, verbose=not quiet)
             
-            if output:
-                Path(output).write_text(content)
-                console.print(f"\n[green]✓ Discussion exported to {output}[/green]")
-            else:
-                console.print(f"\n[dim]{'-' * 80}[/dim]")
-                console.print(content)
+            # Export if requested
+            if export:
+                content = roundtable.export_discussion(discussion, format=export)
+                _echo(f"\n{'-' * 80}", "dim", plain)
+                _echo(content, plain=plain)
         
         if not quiet:
-            console.print("\n[green]✓ Discussion complete![/green]")
+            _echo("\n✓ Discussion complete!", "green", plain)
         
     except Exception as e:
-        console.print(f"\n[red]Error: {e}[/red]")
+        _echo(f"\nError: {e}", "red", plain)
         raise click.Abort()
 
 
@@ -105,7 +129,10 @@ def info():
     except ImportError:
         from llm import get_participant_models
     import os
+    from rich import box
+    from rich.panel import Panel
     
+    console = _get_console()
     console.print(Panel(
         "[bold cyan]Roundtable Configuration[/bold cyan]",
         box=box.ROUNDED,
@@ -134,7 +161,10 @@ def tools_status():
         from .tools import print_tools_status
     except ImportError:
         from tools import print_tools_status
+    from rich import box
+    from rich.panel import Panel
     
+    console = _get_console()
     console.print(Panel(
         "[bold cyan]External Knowledge Tools[/bold cyan]",
         box=box.ROUNDED,
@@ -184,8 +214,10 @@ DEFAULT_BASE_URL=https://api.openai.com/v1
 # External Tools (optional)
 TAVILY_API_KEY=your-tavily-api-key
 """
+    from rich import box
+    from rich.panel import Panel
     
-    console.print(Panel(
+    _get_console().print(Panel(
         example_config,
         title="[bold cyan].env Configuration Example[/bold cyan]",
         box=box.ROUNDED,
@@ -78,9 +78,9 @@ def custom_config_example():
     # Access discussion data
     print(f"\nFirst round, first contribution:")
     first_contrib = discussion.rounds[0]["contributions"][0]
-    print(f"Participant: {first_contrib['participant']}")
-    print(f"Model: {first_contrib['model']}")
-    print(f"Text: {first_contrib['text'][:100]}...")
+    print(f"Participant: {first_contrib.participant}")
+    print(f"Model: {first_contrib.model}")
+    print(f"Text: {first_contrib.text[:100]}...")
 
 
 def analyze_discussion():
@@ -100,7 +100,9 @@ def analyze_discussion():
     print("\nParticipation Analysis:")
     for participant in rt.participants:
         contrib_count = len(participant.contributions)
-        avg_length = sum(len(c) for c in participant.contributions) / contrib_count
+        total_length = sum(len(c) for c in participant.contributions)
+        # A disabled or always-failing participant may have no contributions
+        avg_length = total_length / contrib_count if contrib_count else 0
         print(f"\n{participant.label} ({participant.name}):")
         print(f"  Contributions: {contrib_count}")
         print(f"  Avg length: {avg_length:.0f} characters")
@@ -5,15 +5,193 @@ Supports any OpenAI-compatible API endpoint.
 Copied from tau_helper with enhancements for multi-agent roundtable.
 """
 
+import asyncio
 import os
+import pickle
+import re
+import tempfile
+import weakref
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
 
-# Load environment variables from .env
 _env_path = Path(__file__).parent / ".env"
-load_dotenv(_env_path)
+
+# Matches participant model variables: MODEL1, MODEL2, ... Leading zeros are
+# rejected so MODEL01 cannot alias MODEL1 when API_KEY{i}/BASE_URL{i} are read
+_MODEL_VAR = re.compile(r"^MODEL([1-9]\d*)$")
+
+# Responses are only cached for near-deterministic sampling; replaying a
+# cached answer at a creative temperature would defeat the point of sampling.
+CACHE_MAX_TEMPERATURE = 0.3
+
+
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """
+    Load environment variables from .env (once per process, on first use).
+    
+    With ROUNDTABLE_ENV_CACHE=1 the parsed file is cached between runs.
+    """
+    if os.getenv("ROUNDTABLE_ENV_CACHE") == "1" and _env_path.exists():
+        _load_env_cached(_env_path)
+        return
+    
+    from dotenv import load_dotenv
+    load_dotenv(_env_path)
+
+
+def _load_env_cached(env_path: Path) -> None:
+    """
+    Load .env into os.environ, reusing a pickled parse while the file is unchanged.
+    
+    The cache sits next to .env and is keyed by the file's mtime and size.
+    Like load_dotenv, variables already set in the environment win.
+    """
+    stat = env_path.stat()
+    fingerprint = (stat.st_mtime_ns, stat.st_size)
+    cache_path = env_path.with_name(".env.cache.pkl")
+    
+    values = None
+    try:
+        with open(cache_path, "rb") as f:
+            cached_fingerprint, cached_values = pickle.load(f)
+        if cached_fingerprint == fingerprint:
+            values = cached_values
+    except (OSError, EOFError, TypeError, ValueError, pickle.PickleError):
+        pass
+    
+    if values is None:
+        from dotenv import dotenv_values
+        
+        values = {k: v for k, v in dotenv_values(env_path).items() if v is not None}
+        # Each writer gets its own temp file and renames it into place, so
+        # concurrent cold starts never read or clobber a partial cache
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=env_path.parent, prefix=".env.cache.", suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((fingerprint, values), f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Caching is best effort; the parsed values are still used
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+    
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+
+
+@lru_cache(maxsize=None)
+def _sqlite_cache(database_path: str):
+    """Open (once per path) a LangChain SQLite response cache."""
+    from langchain_community.cache import SQLiteCache
+    return SQLiteCache(database_path=database_path)
+
+
+@lru_cache(maxsize=None)
+def _get_http_clients(base_url: str):
+    """
+    Get the httpx clients shared by every ChatOpenAI client of an endpoint.
+    
+    Participants on the same provider reuse one keep-alive connection pool,
+    so TCP/TLS handshakes are amortized across participants and rounds.
+    Async connections are bound to the event loop that opened them, and
+    discuss() runs each discussion in a fresh loop, so the async client
+    keeps a pool for the current loop only and starts over in a new one;
+    async_http_pools() closes it when the loop's discussions are done.
+    
+    Args:
+        base_url: API base URL the clients will talk to
+    
+    Returns:
+        Tuple of (httpx.Client, httpx.AsyncClient)
+    """
+    import httpx
+    
+    limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    timeout = httpx.Timeout(60.0, connect=5.0)
+    
+    class LoopLocalTransport(httpx.AsyncBaseTransport):
+        def __init__(self):
+            # (loop, pool) swapped as one attribute, so threads never mix them
+            self._current = (None, None)
+        
+        async def handle_async_request(self, request):
+            loop = asyncio.get_running_loop()
+            current_loop, pool = self._current
+            if current_loop is not loop:
+                # Connections of a previous loop can't be reused (or closed)
+                pool = httpx.AsyncHTTPTransport(limits=limits)
+                self._current = (loop, pool)
+            return await pool.handle_async_request(request)
+        
+        async def aclose(self):
+            current_loop, pool = self._current
+            if current_loop is asyncio.get_running_loop():
+                self._current = (None, None)
+                await pool.aclose()
+    
+    transport = LoopLocalTransport()
+    _async_transports.append(transport)
+    return (
+        httpx.Client(limits=limits, timeout=timeout),
+        httpx.AsyncClient(transport=transport, timeout=timeout),
+    )
+
+
+# Loop-local transports of every endpoint, and how many discussions are
+# currently using their pools in each event loop
+_async_transports = []
+_pool_users = weakref.WeakKeyDictionary()
+
+
+@asynccontextmanager
+async def async_http_pools():
+    """
+    Scope the shared async connection pools to the work running inside.
+    
+    When the last scope in the current event loop exits, that loop's pooled
+    connections are closed instead of being left behind with the loop.
+    """
+    loop = asyncio.get_running_loop()
+    _pool_users[loop] = _pool_users.get(loop, 0) + 1
+    try:
+        yield
+    finally:
+        _pool_users[loop] -= 1
+        if not _pool_users[loop]:
+            del _pool_users[loop]
+            for transport in list(_async_transports):
+                await transport.aclose()
+
+
+def _get_response_cache(temperature: float):
+    """
+    Get the response cache for a client, if caching is enabled.
+    
+    Caching is opt-in via ROUNDTABLE_CACHE (path to a SQLite database).
+    Entries are keyed on the exact messages plus the model parameters.
+    
+    Args:
+        temperature: Sampling temperature of the client
+    
+    Returns:
+        SQLiteCache instance, or None when caching doesn't apply
+    """
+    database_path = os.getenv("ROUNDTABLE_CACHE")
+    if not database_path or temperature > CACHE_MAX_TEMPERATURE:
+        return None
+    return _sqlite_cache(database_path)
 
 
 def get_llm_client(
@@ -23,7 +201,7 @@ def get_llm_client(
     temperature: float = 0.7,  # Higher default for creative brainstorming
     max_tokens: Optional[int] = None,
     seed: Optional[int] = None,
-) -> ChatOpenAI:
+) -> "ChatOpenAI":
     """
     Create a LangChain ChatOpenAI client.
     
@@ -36,8 +214,11 @@ def get_llm_client(
         seed: Random seed for reproducibility (optional)
     
     Returns:
-        Configured ChatOpenAI instance
+        Configured ChatOpenAI instance (shared by all calls with the same
+        settings). The client doesn't retry on its own; Roundtable wraps
+        each call with its own timeout and retries.
     """
+    _load_env()
     model = model or os.getenv("DEFAULT_MODEL", "gpt-4o")
     api_key = api_key or os.getenv("DEFAULT_API_KEY")
     base_url = base_url or os.getenv("DEFAULT_BASE_URL", "https://api.openai.com/v1")
@@ -47,11 +228,49 @@ def get_llm_client(
             "API key not provided. Set DEFAULT_API_KEY in .env or pass api_key parameter."
         )
     
+    return _client_for(
+        model,
+        api_key,
+        base_url,
+        temperature,
+        max_tokens,
+        seed,
+        _get_response_cache(temperature),
+    )
+
+
+@lru_cache(maxsize=None)
+def _client_for(
+    model: str,
+    api_key: str,
+    base_url: str,
+    temperature: float,
+    max_tokens: Optional[int],
+    seed: Optional[int],
+    cache,
+) -> "ChatOpenAI":
+    """
+    Build a ChatOpenAI client, once per distinct configuration.
+    
+    ChatOpenAI holds no per-call state, so participants configured with the
+    same model and endpoint can safely share one instance (and its pool).
+    """
+    # Imported here: langchain_openai pulls in openai, httpx and pydantic,
+    # which commands that never talk to a model shouldn't pay for
+    from langchain_openai import ChatOpenAI
+    
+    http_client, http_async_client = _get_http_clients(base_url)
+    
     config = {
         "model": model,
         "openai_api_key": api_key,
         "openai_api_base": base_url,
         "temperature": temperature,
+        "http_client": http_client,
+        "http_async_client": http_async_client,
+        # Roundtable retries (and times out) every call itself; SDK retries
+        # on top of that would multiply attempts during rate-limit storms
+        "max_retries": 0,
     }
     
     if max_tokens:
@@ -60,6 +279,9 @@ def get_llm_client(
     if seed is not None:
         config["seed"] = seed
     
+    if cache is not None:
+        config["cache"] = cache
+    
     return ChatOpenAI(**config)
 
 
@@ -70,17 +292,23 @@ def get_participant_models() -> list[dict]:
     Returns:
         List of model configurations (name, key, base_url)
     """
+    _load_env()
     participants = []
     
-    # Check for MODEL1, MODEL2, MODEL3, etc.
-    i = 1
-    while True:
+    # Collect MODEL1, MODEL2, MODEL3, etc. in one pass; numbering may have gaps
+    indices = sorted(
+        int(match.group(1))
+        for name in os.environ
+        if (match := _MODEL_VAR.match(name))
+    )
+    
+    for i in indices:
         model = os.getenv(f"MODEL{i}")
         api_key = os.getenv(f"API_KEY{i}")
         base_url = os.getenv(f"BASE_URL{i}", "https://api.openai.com/v1")
         
         if not model or not api_key:
-            break
+            continue
             
         participants.append({
             "name": model,
@@ -88,7 +316,6 @@ def get_participant_models() -> list[dict]:
             "base_url": base_url,
             "label": f"Participant {i}"
         })
-        i += 1
     
     # Fallback to default if no participants configured
     if not participants:
@@ -112,7 +339,7 @@ def get_moderator_llm(
     api_key: Optional[str] = None,
     base_url: Optional[str] = None,
     temperature: float = 0.3,  # Lower for more structured facilitation
-) -> ChatOpenAI:
+) -> "ChatOpenAI":
     """
     Get the moderator LLM that facilitates the discussion.
     
@@ -125,6 +352,7 @@ def get_moderator_llm(
     Returns:
         Configured ChatOpenAI instance
     """
+    _load_env()
     model = model or os.getenv("MODERATOR_MODEL")
     api_key = api_key or os.getenv("MODERATOR_API_KEY")
     base_url = base_url or os.getenv("MODERATOR_BASE_URL")
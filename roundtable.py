@@ -4,34 +4,125 @@ Roundtable: Multi-agent brainstorming discussion system.
 Multiple AI models discuss a question in rounds, building on each other's ideas.
 """
 
-from typing import List, Dict, Optional
-from dataclasses import dataclass, field
+import asyncio
+import io
+import sys
+from functools import lru_cache
+from typing import Callable, IO, List, Dict, NamedTuple, Optional, Tuple
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from langchain.schema import HumanMessage, AIMessage, SystemMessage
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 # Handle both package and standalone imports
 try:
-    from .llm import get_llm_client, get_participant_models, get_moderator_llm
+    from .llm import (
+        async_http_pools, get_llm_client, get_participant_models, get_moderator_llm
+    )
 except ImportError:
-    from llm import get_llm_client, get_participant_models, get_moderator_llm
+    from llm import (
+        async_http_pools, get_llm_client, get_participant_models, get_moderator_llm
+    )
 
+PARTICIPANT_SYSTEM_PROMPT = (
+    "You are a thoughtful participant in a roundtable discussion. "
+    "Your goal is to contribute meaningful insights, build on others' ideas, "
+    "and help the group reach a well-reasoned conclusion."
+)
 
-@dataclass
+# Word budget for the moderator's per-round digests
+DIGEST_MAX_WORDS = 60
+
+# Contributions from rounds before the latest one are shortened to this many
+# characters in participant context; the latest round is always sent in full.
+CONTEXT_TRUNCATE_CHARS = 400
+
+# Upper bound on a single LLM call, and how often transient failures are retried
+LLM_TIMEOUT_SECONDS = 45
+MAX_ATTEMPTS = 3
+
+# Participants are skipped for the rest of a discussion after this many
+# consecutive failed rounds
+MAX_CONSECUTIVE_FAILURES = 3
+
+
+@lru_cache(maxsize=1)
+def _retryable_errors() -> tuple:
+    """Errors worth retrying: timeouts, dropped connections and rate limits."""
+    # Imported here so importing the package doesn't load openai and httpx
+    import httpx
+    import openai
+    
+    return (
+        asyncio.TimeoutError,
+        httpx.TimeoutException,
+        openai.APIConnectionError,
+        openai.RateLimitError,
+    )
+
+
+async def _acall_with_retry(make_call, semaphore: asyncio.Semaphore):
+    """
+    Await an LLM call with a timeout, retrying transient failures.
+    
+    A semaphore slot is held per attempt, not across the backoff sleeps, so
+    a failing participant doesn't keep others waiting while it backs off.
+    
+    Args:
+        make_call: Zero-argument callable returning a fresh awaitable per attempt
+        semaphore: Caps concurrent requests across the discussion
+    
+    Returns:
+        Result of the first successful attempt
+    """
+    async for attempt in AsyncRetrying(
+        stop=stop_after_attempt(MAX_ATTEMPTS),
+        wait=wait_exponential(min=1, max=8),
+        retry=retry_if_exception_type(_retryable_errors()),
+        reraise=True,
+    ):
+        with attempt:
+            async with semaphore:
+                return await asyncio.wait_for(make_call(), LLM_TIMEOUT_SECONDS)
+
+
+class _Notice(NamedTuple):
+    """A warning queued alongside a participant's streamed chunks."""
+    text: str
+
+
+class Contribution(NamedTuple):
+    """A single participant's contribution to a round."""
+    participant: str
+    model: str
+    text: str
+
+
+@dataclass(slots=True)
 class Participant:
     """A participant in the roundtable discussion."""
     name: str
     label: str
     llm: any
     contributions: List[str] = field(default_factory=list)
+    failures: int = 0
+    disabled: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Discussion:
     """A complete roundtable discussion."""
     question: str
     rounds: List[Dict] = field(default_factory=list)
     final_summary: Optional[str] = None
     file_data: Optional[List[Dict]] = None
+    # Rendered context blocks, keyed by (round_number, excluded label, truncated)
+    _context_blocks: Dict = field(default_factory=dict, repr=False, compare=False)
 
 
 class Roundtable:
@@ -49,6 +140,7 @@ class Roundtable:
         moderator_enabled: bool = True,
         tools_enabled: bool = False,
         data_files: Optional[List[str]] = None,
+        max_inflight: Optional[int] = None,
     ):
         """
         Initialize the roundtable.
@@ -59,6 +151,8 @@ class Roundtable:
             moderator_enabled: Whether to use a moderator to guide discussion
             tools_enabled: Whether to enable external knowledge tools
             data_files: List of file paths or directory paths containing text files
+            max_inflight: Maximum number of concurrent LLM requests
+                (defaults to one per participant, plus one for the moderator)
         """
         self.max_rounds = max_rounds
         self.temperature = temperature
@@ -72,21 +166,37 @@ class Roundtable:
         # Initialize moderator if enabled
         self.moderator = get_moderator_llm() if moderator_enabled else None
         
+        # The moderator's background digest gets its own slot so it never
+        # holds up a participant in the next round
+        self.max_inflight = max_inflight or max(
+            len(self.participants) + (self.moderator is not None), 1
+        )
+        
         # Load tools if enabled
         self.tools = None
         if tools_enabled:
             try:
                 try:
-                    from .tools import AVAILABLE_TOOLS
+                    from .tools import get_available_tools
                 except ImportError:
-                    from tools import AVAILABLE_TOOLS
-                self.tools = AVAILABLE_TOOLS
+                    from tools import get_available_tools
+                self.tools = get_available_tools()
                 if self.tools:
                     print(f"✅ Loaded {len(self.tools)} external knowledge tools")
             except Exception as e:
                 print(f"⚠️ Failed to load tools: {e}")
                 self.tools = None
         
+        # The system prompt is the same for every participant call, so build
+        # it once; an identical message also keeps provider caches warm
+        self._tools_desc = "".join(
+            f"- {tool.name}: {tool.description}\n" for tool in (self.tools or [])
+        )
+        system_msg = PARTICIPANT_SYSTEM_PROMPT
+        if self._tools_desc:
+            system_msg += "\n\nAvailable tools for research:\n" + self._tools_desc
+        self._system_message = SystemMessage(content=system_msg)
+        
         if not self.participants:
             raise ValueError(
                 "No participants configured. Set MODEL1, API_KEY1, etc. in .env"
@@ -96,6 +206,8 @@ class Roundtable:
         """Initialize all participant LLMs from configuration."""
         participants = []
         
+        # Participants configured with the same model and endpoint get the
+        # same client back, sharing one instance and its connection pool
         for config in get_participant_models():
             llm = get_llm_client(
                 model=config["name"],
@@ -137,16 +249,19 @@ class Roundtable:
             print(f"⚠️ Failed to read {file_path}: {e}")
             return None
     
-    def _load_data_files(self) -> List[Dict]:
+    def _load_data_files(self, paths: List[str]) -> List[Dict]:
         """
-        Load all text files from the provided file/directory paths.
+        Load all text files from the given file/directory paths.
+        
+        Args:
+            paths: File paths or directory paths containing text files
         
         Returns:
             List of dicts containing file information and content
         """
         file_data = []
         
-        for path_str in self.data_files:
+        for path_str in paths:
             path = Path(path_str)
             
             if not path.exists():
@@ -173,21 +288,80 @@ class Roundtable:
         
         return file_data
     
-    def discuss(self, question: str, verbose: bool = True) -> Discussion:
+    def discuss(
+        self,
+        question: str,
+        verbose: bool = True,
+        on_round: Optional[Callable[[Discussion, Dict], None]] = None,
+        data_files: Optional[List[str]] = None,
+    ) -> Discussion:
         """
         Conduct a roundtable discussion on a question.
         
         Args:
             question: The question or topic to discuss
             verbose: Whether to print progress
+            on_round: Called with (discussion, round_data) after each round
+            data_files: Files/directories for this discussion only, in place
+                of the ones given to the constructor
         
         Returns:
             Complete discussion with all rounds and summary
         """
+        return asyncio.run(
+            self.adiscuss(
+                question, verbose=verbose, on_round=on_round, data_files=data_files
+            )
+        )
+    
+    async def adiscuss(
+        self,
+        question: str,
+        verbose: bool = True,
+        on_round: Optional[Callable[[Discussion, Dict], None]] = None,
+        data_files: Optional[List[str]] = None,
+    ) -> Discussion:
+        """
+        Conduct a roundtable discussion on a question asynchronously.
+        
+        Args:
+            question: The question or topic to discuss
+            verbose: Whether to print progress
+            on_round: Called with (discussion, round_data) after each round
+            data_files: Files/directories for this discussion only, in place
+                of the ones given to the constructor
+        
+        Returns:
+            Complete discussion with all rounds and summary
+        """
+        # Close pooled connections when done; the loop may not outlive us
+        async with async_http_pools():
+            return await self._arun_discussion(
+                question, verbose, on_round, data_files
+            )
+    
+    async def _arun_discussion(
+        self,
+        question: str,
+        verbose: bool,
+        on_round: Optional[Callable[[Discussion, Dict], None]],
+        data_files: Optional[List[str]],
+    ) -> Discussion:
+        """Run the rounds and summary of a discussion (see adiscuss)."""
+        # Caps concurrent requests across participants and the moderator
+        semaphore = asyncio.Semaphore(self.max_inflight)
+        
+        # The failure breaker only lasts for one discussion
+        for participant in self.participants:
+            participant.failures = 0
+            participant.disabled = False
+        
         # Load data files if provided
+        if data_files is None:
+            data_files = self.data_files
         file_data = []
-        if self.data_files:
-            file_data = self._load_data_files()
+        if data_files:
+            file_data = self._load_data_files(data_files)
             if file_data and verbose:
                 total_size = sum(f['size'] for f in file_data)
                 print(f"📁 Loaded {len(file_data)} file(s) ({total_size:,} characters)")
@@ -207,89 +381,279 @@ class Roundtable:
                     print(f"   • {tool.name}")
             print(f"\n{'='*80}\n")
         
-        # Conduct discussion rounds
+        # Conduct discussion rounds. The moderator digests each finished round
+        # in the background while the next round is under way.
+        digest_tasks = []
+        summary_task = None
         for round_num in range(1, self.max_rounds + 1):
+            if all(p.disabled for p in self.participants):
+                print("⚠️ All participants are disabled; ending discussion early")
+                break
+            
             if verbose:
                 print(f"🔄 Round {round_num}/{self.max_rounds}")
                 print(f"{'-'*80}\n")
             
-            round_data = self._conduct_round(round_num, discussion, verbose)
+            round_data, printing = await self._aconduct_round(
+                round_num, discussion, verbose, semaphore
+            )
             discussion.rounds.append(round_data)
+            if on_round is not None:
+                on_round(discussion, round_data)
+            
+            if self.moderator and round_data["contributions"]:
+                digest_tasks.append(asyncio.create_task(
+                    self._adigest_round(round_data, semaphore)
+                ))
+            
+            # The summary only needs finished contributions, so start it as
+            # soon as the last round is in, while its output is still printing
+            if round_num == self.max_rounds and self.moderator_enabled:
+                summary_task = asyncio.create_task(
+                    self._agenerate_summary(discussion, digest_tasks, semaphore)
+                )
+            
+            if printing is not None:
+                await printing
         
         # Generate final summary
         if self.moderator_enabled:
-            discussion.final_summary = self._generate_summary(discussion, verbose)
+            if summary_task is None:  # discussion ended early
+                summary_task = asyncio.create_task(
+                    self._agenerate_summary(discussion, digest_tasks, semaphore)
+                )
+            
+            if verbose:
+                print(f"\n{'='*80}")
+                print("📊 Generating Final Summary...\n")
+            
+            discussion.final_summary = await summary_task
+            
+            if verbose:
+                print(f"📋 Final Summary:")
+                print(f"{discussion.final_summary}\n")
         
         return discussion
     
-    def _conduct_round(
+    async def _aconduct_round(
         self,
         round_num: int,
         discussion: Discussion,
         verbose: bool,
-    ) -> Dict:
-        """Conduct a single round of discussion."""
+        semaphore: asyncio.Semaphore,
+    ) -> Tuple[Dict, Optional[asyncio.Task]]:
+        """
+        Conduct a single round of discussion.
+        
+        Returns as soon as every contribution is in. In verbose mode the
+        printer may still be writing buffered output; its task is returned
+        alongside the round data so callers can overlap work with it.
+        """
         round_data = {
             "round_number": round_num,
             "contributions": []
         }
         
+        # Every participant sees the same snapshot of previous rounds, so all
+        # prompts can be built up front and the LLM calls run concurrently.
+        pairs = []
         for participant in self.participants:
-            # Build context from previous contributions
+            if participant.disabled:
+                continue
             context = self._build_context(discussion, participant)
-            
-            # Get participant's contribution
             prompt = self._create_participant_prompt(
                 discussion.question,
                 round_num,
                 context,
                 file_data=discussion.file_data,
             )
+            pairs.append((participant, prompt))
+        
+        async def stream(
+            participant: Participant, prompt: List, queue: asyncio.Queue
+        ) -> Optional[str]:
+            chunks = []
+            
+            async def attempt() -> str:
+                if chunks:
+                    # A previous attempt failed mid-stream; start over
+                    chunks.clear()
+                    queue.put_nowait("\n⚠️ Retrying...\n")
+                if participant.llm.cache is not None:
+                    # astream never consults LangChain's response cache, so
+                    # cached clients answer in one piece through ainvoke
+                    response = await participant.llm.ainvoke(prompt)
+                    chunks.append(response.content)
+                    queue.put_nowait(response.content)
+                else:
+                    async for chunk in participant.llm.astream(prompt):
+                        chunks.append(chunk.content)
+                        queue.put_nowait(chunk.content)
+                return "".join(chunks)
             
-            response = participant.llm.invoke(prompt)
-            contribution = response.content
+            try:
+                contribution = await _acall_with_retry(attempt, semaphore)
+            except Exception as e:
+                # Printing directly would land inside whichever participant
+                # is streaming, so hand the warning to the printer instead
+                self._record_failure(
+                    participant, e, lambda text: queue.put_nowait(_Notice(text))
+                )
+                return None
+            finally:
+                # Always release the printer, even if the stream failed
+                queue.put_nowait(None)
+            participant.failures = 0
+            return contribution
+        
+        # gather preserves submission order, keeping contributions ordered
+        if verbose:
+            queues = [asyncio.Queue() for _ in pairs]
+            printer = asyncio.create_task(self._print_streams(pairs, queues))
+            contributions = await asyncio.gather(*(
+                stream(participant, prompt, queue)
+                for (participant, prompt), queue in zip(pairs, queues)
+            ))
+        else:
+            printer = None
+            contributions = await self._ainvoke_contributions(pairs, semaphore)
+        
+        for (participant, _), contribution in zip(pairs, contributions):
+            if contribution is None:
+                continue
             
             # Store contribution
             participant.contributions.append(contribution)
-            round_data["contributions"].append({
-                "participant": participant.label,
-                "model": participant.name,
-                "text": contribution,
-            })
-            
-            if verbose:
-                print(f"💬 {participant.label} ({participant.name}):")
-                print(f"{contribution}\n")
+            round_data["contributions"].append(
+                Contribution(participant.label, participant.name, contribution)
+            )
+        
+        return round_data, printer
+    
+    async def _ainvoke_contributions(
+        self,
+        pairs: List,
+        semaphore: asyncio.Semaphore,
+    ) -> List[Optional[str]]:
+        """
+        Get non-streamed contributions, all participants at once.
+        
+        Each request is timed out and retried on its own, as in the streaming
+        path, so one hung call never takes the others down. Participants
+        whose calls still fail get None.
+        """
+        async def call(participant: Participant, prompt: List) -> Optional[str]:
+            try:
+                response = await _acall_with_retry(
+                    lambda: participant.llm.ainvoke(prompt), semaphore
+                )
+            except Exception as e:
+                self._record_failure(participant, e)
+                return None
+            participant.failures = 0
+            return response.content
+        
+        return await asyncio.gather(*(
+            call(participant, prompt) for participant, prompt in pairs
+        ))
+    
+    @staticmethod
+    def _record_failure(
+        participant: Participant,
+        error: Exception,
+        warn: Callable[[str], None] = print,
+    ) -> None:
+        """Count a failed call and disable the participant if it keeps failing."""
+        participant.failures += 1
+        warn(f"⚠️ {participant.label} ({participant.name}) failed: {error!r}")
+        if participant.failures >= MAX_CONSECUTIVE_FAILURES:
+            participant.disabled = True
+            warn(
+                f"⚠️ {participant.label} disabled after "
+                f"{participant.failures} consecutive failures"
+            )
+    
+    @staticmethod
+    async def _print_streams(pairs: List, queues: List[asyncio.Queue]) -> None:
+        """
+        Print streamed contributions as their chunks arrive.
         
-        return round_data
+        Participants are printed one after another in their usual order;
+        chunks from participants further down the list are buffered in
+        their queue until it is their turn. The header is only printed once
+        a participant produces output, and queued warnings follow it.
+        """
+        for (participant, _), queue in zip(pairs, queues):
+            started = False
+            notices = []
+            while (chunk := await queue.get()) is not None:
+                if isinstance(chunk, _Notice):
+                    notices.append(chunk.text)
+                    continue
+                if not started:
+                    sys.stdout.write(f"💬 {participant.label} ({participant.name}):\n")
+                    started = True
+                sys.stdout.write(chunk)
+                sys.stdout.flush()
+            if started:
+                sys.stdout.write("\n\n")
+            for text in notices:
+                sys.stdout.write(f"{text}\n")
+            sys.stdout.flush()
     
     def _build_context(self, discussion: Discussion, current_participant: Participant) -> str:
         """Build context string from previous discussion rounds."""
         if not discussion.rounds:
             return ""
         
-        context_parts = []
+        latest_round = discussion.rounds[-1]
+        buf = io.StringIO()
+        w = buf.write
+        
+        for i, round_data in enumerate(discussion.rounds):
+            if i:
+                w("\n")
+            w(self._render_round_block(
+                discussion,
+                round_data,
+                current_participant.label,
+                truncated=round_data is not latest_round,
+            ))
+        
+        return buf.getvalue()
+    
+    @staticmethod
+    def _render_round_block(
+        discussion: Discussion,
+        round_data: Dict,
+        exclude_label: str,
+        truncated: bool,
+    ) -> str:
+        """
+        Render one round of context, leaving out one participant's lines.
         
-        for round_data in discussion.rounds:
-            round_num = round_data["round_number"]
-            context_parts.append(f"\n--- Round {round_num} ---")
-            
-            for contrib in round_data["contributions"]:
-                if contrib["participant"] != current_participant.label:
-                    context_parts.append(
-                        f"\n{contrib['participant']}: {contrib['text']}"
-                    )
-        
-        # Add current round contributions (from other participants)
-        if discussion.rounds and len(discussion.rounds[-1]["contributions"]) > 0:
-            latest_round = discussion.rounds[-1]
-            for contrib in latest_round["contributions"]:
-                if contrib["participant"] != current_participant.label:
-                    context_parts.append(
-                        f"\n{contrib['participant']}: {contrib['text']}"
-                    )
-        
-        return "\n".join(context_parts)
+        Blocks are cached on the discussion: a finished round never changes,
+        so each (round, participant, truncated) variant is built only once
+        instead of on every later call.
+        """
+        key = (round_data["round_number"], exclude_label, truncated)
+        block = discussion._context_blocks.get(key)
+        if block is not None:
+            return block
+        
+        buf = io.StringIO()
+        w = buf.write
+        w(f"\n--- Round {round_data['round_number']} ---")
+        for contrib in round_data["contributions"]:
+            if contrib.participant != exclude_label:
+                text = contrib.text
+                if truncated and len(text) > CONTEXT_TRUNCATE_CHARS:
+                    text = text[:CONTEXT_TRUNCATE_CHARS] + "..."
+                w(f"\n\n{contrib.participant}: {text}")
+        
+        block = buf.getvalue()
+        discussion._context_blocks[key] = block
+        return block
     
     def _create_participant_prompt(
         self,
@@ -299,19 +663,6 @@ class Roundtable:
         file_data: Optional[List[Dict]] = None,
     ) -> List:
         """Create the prompt for a participant's contribution."""
-        system_msg = (
-            "You are a thoughtful participant in a roundtable discussion. "
-            "Your goal is to contribute meaningful insights, build on others' ideas, "
-            "and help the group reach a well-reasoned conclusion."
-        )
-        
-        # Add tool information if available
-        if self.tools:
-            tools_desc = "\n\nAvailable tools for research:\n"
-            for tool in self.tools:
-                tools_desc += f"- {tool.name}: {tool.description}\n"
-            system_msg += tools_desc
-        
         # Add file data information if available
         file_context = ""
         if file_data:
@@ -321,17 +672,18 @@ class Roundtable:
                 file_context += f"--- FILE: {f['filename']} ---\n"
                 file_context += f"{f['content']}\n\n"
         
+        # The topic (and any file data) is identical for every call in a
+        # discussion, so it goes in its own message ahead of the round-specific
+        # text. That keeps the prompt prefix stable for provider-side caching.
+        topic_msg = f"We're discussing: {question}\n{file_context}"
+        
         if round_num == 1:
-            user_msg = (
-                f"We're discussing: {question}\n"
-                f"{file_context}\n"
+            round_msg = (
                 f"This is Round {round_num}. Please share your initial thoughts and insights. "
                 f"Be specific, insightful, and concise (2-4 sentences)."
             )
         else:
-            user_msg = (
-                f"We're discussing: {question}\n"
-                f"{file_context}\n"
+            round_msg = (
                 f"This is Round {round_num}. Here's what others have said:\n"
                 f"{context}\n\n"
                 f"Please respond by:\n"
@@ -342,30 +694,65 @@ class Roundtable:
             )
         
         return [
-            SystemMessage(content=system_msg),
-            HumanMessage(content=user_msg),
+            self._system_message,
+            HumanMessage(content=topic_msg),
+            HumanMessage(content=round_msg),
         ]
     
-    def _generate_summary(self, discussion: Discussion, verbose: bool) -> str:
+    async def _adigest_round(
+        self,
+        round_data: Dict,
+        semaphore: asyncio.Semaphore,
+    ) -> str:
+        """Have the moderator condense a finished round into a short digest."""
+        round_text = "\n".join(
+            f"{contrib.participant}: {contrib.text}"
+            for contrib in round_data["contributions"]
+        )
+        
+        prompt = [
+            SystemMessage(content=(
+                f"Summarize this round of a roundtable discussion in at most "
+                f"{DIGEST_MAX_WORDS} words. Keep each participant's key points "
+                f"and note agreements or disagreements."
+            )),
+            HumanMessage(content=round_text),
+        ]
+        
+        try:
+            response = await _acall_with_retry(
+                lambda: self.moderator.ainvoke(prompt), semaphore
+            )
+            round_data["digest"] = response.content
+        except Exception as e:
+            # Fall back to the raw round so the final summary still sees it
+            print(f"⚠️ Failed to digest round {round_data['round_number']}: {e!r}")
+            round_data["digest"] = round_text
+        return round_data["digest"]
+    
+    async def _agenerate_summary(
+        self,
+        discussion: Discussion,
+        digest_tasks: List[asyncio.Task],
+        semaphore: asyncio.Semaphore,
+    ) -> str:
         """Generate a final summary of the discussion using the moderator."""
         if not self.moderator:
             return ""
         
-        if verbose:
-            print(f"\n{'='*80}")
-            print("📊 Generating Final Summary...\n")
+        await asyncio.gather(*digest_tasks)
         
-        # Compile all contributions
-        all_contributions = []
+        # Compile the per-round digests rather than every raw contribution,
+        # so the summary prompt grows with rounds, not rounds x participants
+        digests = []
         for round_data in discussion.rounds:
             round_num = round_data["round_number"]
-            all_contributions.append(f"\n--- Round {round_num} ---")
-            for contrib in round_data["contributions"]:
-                all_contributions.append(
-                    f"\n{contrib['participant']}: {contrib['text']}"
-                )
+            if "digest" not in round_data:
+                continue
+            digests.append(f"\n--- Round {round_num} ---")
+            digests.append(round_data["digest"])
         
-        contributions_text = "\n".join(all_contributions)
+        contributions_text = "\n".join(digests)
         
         prompt = [
             SystemMessage(content=(
@@ -383,16 +770,16 @@ class Roundtable:
             )),
         ]
         
-        response = self.moderator.invoke(prompt)
-        summary = response.content
-        
-        if verbose:
-            print(f"📋 Final Summary:")
-            print(f"{summary}\n")
-        
-        return summary
+        response = await _acall_with_retry(
+            lambda: self.moderator.ainvoke(prompt), semaphore
+        )
+        return response.content
     
-    def export_discussion(self, discussion: Discussion, format: str = "markdown") -> str:
+    def export_discussion(
+        self,
+        discussion: Discussion,
+        format: str = "markdown",
+    ) -> str:
         """
         Export the discussion in various formats.
         
@@ -403,62 +790,132 @@ class Roundtable:
         Returns:
             Formatted discussion string
         """
-        if format == "markdown":
-            return self._export_markdown(discussion)
-        elif format == "json":
-            import json
-            return json.dumps(discussion.__dict__, indent=2)
-        else:  # text
-            return self._export_text(discussion)
+        if format == "json":
+            import orjson
+            return orjson.dumps(
+                self._discussion_to_dict(discussion),
+                option=orjson.OPT_INDENT_2,
+            ).decode()
+        
+        buf = io.StringIO()
+        self._write_export_header(buf, discussion, format)
+        for round_data in discussion.rounds:
+            self._write_export_round(buf, round_data, format)
+        self._write_export_summary(buf, discussion, format)
+        
+        return buf.getvalue()
     
-    def _export_markdown(self, discussion: Discussion) -> str:
-        """Export discussion as markdown."""
-        lines = [
-            f"# Roundtable Discussion\n",
-            f"## Question\n",
-            f"{discussion.question}\n",
-            f"\n## Discussion\n",
-        ]
+    def stream_export(
+        self,
+        question: str,
+        fp: IO[str],
+        format: str = "markdown",
+        verbose: bool = True,
+    ) -> Discussion:
+        """
+        Conduct a discussion, writing its export to a file as rounds complete.
         
-        for round_data in discussion.rounds:
-            round_num = round_data["round_number"]
-            lines.append(f"\n### Round {round_num}\n")
-            
-            for contrib in round_data["contributions"]:
-                lines.append(
-                    f"\n**{contrib['participant']}** ({contrib['model']}):\n"
-                )
-                lines.append(f"{contrib['text']}\n")
+        Nothing is buffered in memory: the header is written with the first
+        round, each round is flushed as soon as it finishes, and the summary
+        is appended at the end. JSON is written as JSON Lines (one record
+        for the question, one per round, one for the summary).
         
-        if discussion.final_summary:
-            lines.append(f"\n## Final Summary\n")
-            lines.append(f"{discussion.final_summary}\n")
+        Args:
+            question: The question or topic to discuss
+            fp: Text file handle to write to
+            format: Export format (markdown, json, text)
+            verbose: Whether to print progress
         
-        return "\n".join(lines)
+        Returns:
+            Complete discussion with all rounds and summary
+        """
+        header_written = False
+        
+        def write_round(discussion: Discussion, round_data: Dict) -> None:
+            nonlocal header_written
+            if not header_written:
+                self._write_export_header(fp, discussion, format)
+                header_written = True
+            self._write_export_round(fp, round_data, format)
+            fp.flush()
+        
+        discussion = self.discuss(question, verbose=verbose, on_round=write_round)
+        
+        if not header_written:
+            self._write_export_header(fp, discussion, format)
+        self._write_export_summary(fp, discussion, format)
+        fp.flush()
+        
+        return discussion
     
-    def _export_text(self, discussion: Discussion) -> str:
-        """Export discussion as plain text."""
-        lines = [
-            f"ROUNDTABLE DISCUSSION",
-            f"=" * 80,
-            f"\nQuestion: {discussion.question}\n",
+    @staticmethod
+    def _discussion_to_dict(discussion: Discussion) -> Dict:
+        """Get the public fields of a discussion as plain dicts and lists."""
+        data = {
+            f.name: getattr(discussion, f.name)
+            for f in fields(discussion)
+            if not f.name.startswith("_")
+        }
+        data["rounds"] = [
+            {**round_data, "contributions": [c._asdict() for c in round_data["contributions"]]}
+            for round_data in discussion.rounds
         ]
-        
-        for round_data in discussion.rounds:
-            round_num = round_data["round_number"]
-            lines.append(f"\n--- Round {round_num} ---\n")
+        return data
+    
+    @staticmethod
+    def _write_json_line(fp: IO[str], record: Dict) -> None:
+        """Write one JSON Lines record."""
+        import orjson
+        fp.write(orjson.dumps(record).decode())
+        fp.write("\n")
+    
+    def _write_export_header(self, fp: IO[str], discussion: Discussion, format: str) -> None:
+        """Write the export header (title and question)."""
+        w = fp.write
+        if format == "markdown":
+            w("# Roundtable Discussion\n\n## Question\n\n")
+            w(f"{discussion.question}\n\n\n## Discussion\n")
+        elif format == "json":
+            self._write_json_line(fp, {
+                "question": discussion.question,
+                "file_data": discussion.file_data,
+            })
+        else:  # text
+            w(f"ROUNDTABLE DISCUSSION\n{'=' * 80}\n")
+            w(f"\nQuestion: {discussion.question}\n")
+    
+    def _write_export_round(self, fp: IO[str], round_data: Dict, format: str) -> None:
+        """Write a single round of the export."""
+        w = fp.write
+        if format == "markdown":
+            w(f"\n\n### Round {round_data['round_number']}\n")
             
             for contrib in round_data["contributions"]:
-                lines.append(
-                    f"{contrib['participant']} ({contrib['model']}):"
-                )
-                lines.append(f"{contrib['text']}\n")
-        
-        if discussion.final_summary:
-            lines.append(f"\n{'-' * 80}")
-            lines.append(f"FINAL SUMMARY:")
-            lines.append(f"{'-' * 80}")
-            lines.append(f"{discussion.final_summary}\n")
+                w(f"\n\n**{contrib.participant}** ({contrib.model}):\n\n")
+                w(f"{contrib.text}\n")
+        elif format == "json":
+            # The moderator's digest may still be pending, so it's left out
+            self._write_json_line(fp, {
+                "round_number": round_data["round_number"],
+                "contributions": [c._asdict() for c in round_data["contributions"]],
+            })
+        else:  # text
+            w(f"\n\n--- Round {round_data['round_number']} ---\n")
+            
+            for contrib in round_data["contributions"]:
+                w(f"\n{contrib.participant} ({contrib.model}):\n")
+                w(f"{contrib.text}\n")
+    
+    def _write_export_summary(self, fp: IO[str], discussion: Discussion, format: str) -> None:
+        """Write the final summary, if the discussion has one."""
+        if not discussion.final_summary:
+            return
         
-        return "\n".join(lines)
-
+        w = fp.write
+        if format == "markdown":
+            w(f"\n\n## Final Summary\n\n{discussion.final_summary}\n")
+        elif format == "json":
+            self._write_json_line(fp, {"final_summary": discussion.final_summary})
+        else:  # text
+            w(f"\n\n{'-' * 80}\nFINAL SUMMARY:\n{'-' * 80}\n")
+            w(f"{discussion.final_summary}\n")
@@ -3,30 +3,32 @@
 
 import sys
 import os
+from importlib.util import find_spec
 from pathlib import Path
 
 # Ensure we're in the right directory
 os.chdir(Path(__file__).parent)
 sys.path.insert(0, str(Path(__file__).parent))
 
-print("=" * 80)
-print("ROUNDTABLE: What's the meaning of life?")
-print("=" * 80)
-print()
+API_KEYS = ("API_KEY1", "API_KEY2", "API_KEY3", "API_KEY4")
+RULE = "=" * 80
+
+sys.stdout.write(f"{RULE}\nROUNDTABLE: What's the meaning of life?\n{RULE}\n\n")
 
 try:
     # Check dependencies
     print("Checking dependencies...")
-    try:
-        import click
-        import rich
-        from langchain_openai import ChatOpenAI
-        from dotenv import load_dotenv
-        print("✓ Dependencies loaded")
-    except ImportError as e:
-        print(f"✗ Missing dependency: {e}")
+    # Only check that the packages are installed; importing them here would
+    # load langchain_openai (and pydantic, httpx, ...) before it's needed
+    missing = [
+        mod for mod in ("click", "rich", "langchain_openai", "dotenv")
+        if find_spec(mod) is None
+    ]
+    if missing:
+        print(f"✗ Missing dependencies: {', '.join(missing)}")
         print("\nInstall with: pip install -r requirements.txt")
         sys.exit(1)
+    print("✓ Dependencies found")
     
     # Load .env
     print("Loading .env...")
@@ -35,25 +37,23 @@ try:
         print(f"✗ .env not found at: {env_path}")
         sys.exit(1)
     
-    load_dotenv(env_path)
+    # Same loader Roundtable uses, so the file is only parsed once per run
+    # (and not at all with ROUNDTABLE_ENV_CACHE=1 while .env is unchanged)
+    from llm import _load_env
+    _load_env()
     print("✓ .env loaded")
     print()
     
-    # Check API keys
-    print("Checking API keys...")
-    api_keys = {
-        'API_KEY1': os.getenv('API_KEY1'),
-        'API_KEY2': os.getenv('API_KEY2'),
-        'API_KEY3': os.getenv('API_KEY3'),
-        'API_KEY4': os.getenv('API_KEY4'),
-    }
-    
-    for key, value in api_keys.items():
-        if value:
-            print(f"✓ {key}: {value[:15]}...")
+    # Check API keys (presence only; the provider rejects bad keys on the
+    # first request, so there's no separate validation round-trip)
+    env = os.environ
+    lines = ["Checking API keys..."]
+    for key in API_KEYS:
+        if env.get(key):
+            lines.append(f"✓ {key}: set")
         else:
-            print(f"✗ {key}: NOT SET")
-    print()
+            lines.append(f"✗ {key}: NOT SET")
+    sys.stdout.write("\n".join(lines) + "\n\n")
     
     # Import and run
     print("Initializing roundtable...")
@@ -66,26 +66,19 @@ try:
         tools_enabled=False,
     )
     
-    print(f"✓ Loaded {len(rt.participants)} participants:")
-    for p in rt.participants:
-        print(f"  - {p.label}: {p.name}")
-    print()
-    print("=" * 80)
-    print()
+    lines = [f"✓ Loaded {len(rt.participants)} participants:"]
+    lines.extend(f"  - {p.label}: {p.name}" for p in rt.participants)
+    sys.stdout.write("\n".join(lines) + f"\n\n{RULE}\n\n")
+    sys.stdout.flush()
     
     # Run discussion
     discussion = rt.discuss("What's the meaning of life?", verbose=True)
     
-    print()
-    print("=" * 80)
-    print("✓ DISCUSSION COMPLETE")
-    print("=" * 80)
+    sys.stdout.write(f"\n{RULE}\n✓ DISCUSSION COMPLETE\n{RULE}\n")
     
 except Exception as e:
-    print()
-    print("=" * 80)
-    print(f"✗ ERROR: {e}")
-    print("=" * 80)
+    sys.stdout.write(f"\n{RULE}\n✗ ERROR: {e}\n{RULE}\n")
+    sys.stdout.flush()
     import traceback
     traceback.print_exc()
     sys.exit(1)
@@ -4,19 +4,14 @@ Test script to demonstrate data files feature.
 Creates sample text files and runs a discussion with them.
 """
 
+import sys
 import tempfile
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def create_sample_files(tmpdir):
-    """Create sample text files for testing."""
-    # Create a subdirectory
-    data_dir = Path(tmpdir) / "data"
-    data_dir.mkdir(exist_ok=True)
-    
-    # Sample file 1: AI trends
-    file1 = data_dir / "ai_trends.txt"
-    file1.write_text("""
+# Sample file contents (ASCII, written as-is)
+_AI_TRENDS = b"""
 AI Industry Trends 2025
 
 Key observations:
@@ -25,11 +20,9 @@ Key observations:
 - AI ethics and safety remain critical concerns
 - Open-source models are challenging proprietary solutions
 - Enterprise adoption is accelerating across all sectors
-""")
-    
-    # Sample file 2: Market data
-    file2 = data_dir / "market_data.txt"
-    file2.write_text("""
+"""
+
+_MARKET_DATA = b"""
 Technology Market Analysis Q1 2025
 
 Findings:
@@ -38,11 +31,9 @@ Findings:
 - Investment in AI infrastructure up 45% YoY
 - Developer tools and platforms fastest growing segment
 - Concerns about AI regulation impacting growth
-""")
-    
-    # Sample file 3: Customer feedback
-    file3 = tmpdir / "feedback.txt"
-    file3.write_text("""
+"""
+
+_FEEDBACK = b"""
 Customer Feedback Summary
 
 Positive:
@@ -54,90 +45,108 @@ Areas for improvement:
 - Need better documentation
 - Some features are hard to discover
 - Pricing could be more flexible
-""")
+"""
+
+# Paths already created by create_sample_files, keyed by tmpdir
+_SAMPLE_CACHE = {}
+
+
+def _write_banner(title, footer=""):
+    """Write a ruled section banner to stdout in one call."""
+    rule = "=" * 80
+    sys.stdout.write(f"\n{rule}\n{title}\n{rule}\n{footer}")
+    sys.stdout.flush()
+
+
+def create_sample_files(tmpdir):
+    """Create sample text files for testing (once per tmpdir)."""
+    cached = _SAMPLE_CACHE.get(str(tmpdir))
+    if cached:
+        return cached
     
-    return str(data_dir), str(file3)
+    # Create a subdirectory
+    data_dir = Path(tmpdir) / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Sample files: AI trends, market data, customer feedback
+    file1 = data_dir / "ai_trends.txt"
+    file2 = data_dir / "market_data.txt"
+    file3 = Path(tmpdir) / "feedback.txt"
+    
+    # The writes are independent, so overlap them
+    pairs = [(file1, _AI_TRENDS), (file2, _MARKET_DATA), (file3, _FEEDBACK)]
+    with ThreadPoolExecutor(max_workers=len(pairs)) as ex:
+        list(ex.map(lambda pc: pc[0].write_bytes(pc[1]), pairs))
+    
+    paths = _SAMPLE_CACHE[str(tmpdir)] = (str(data_dir), str(file3))
+    return paths
 
 
-def test_single_file():
+def run_single_file(rt, feedback_file):
     """Test with a single file."""
-    print("\n" + "="*80)
-    print("TEST 1: Single File")
-    print("="*80)
+    _write_banner("TEST 1: Single File")
     
-    try:
-        from roundtable import Roundtable
-    except ImportError:
-        print("❌ Error: Could not import roundtable. Make sure it's installed.")
-        return
+    print(f"\n📁 Testing with single file: {Path(feedback_file).name}")
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        _, feedback_file = create_sample_files(tmpdir)
-        
-        print(f"\n📁 Testing with single file: {Path(feedback_file).name}")
-        
-        rt = Roundtable(
-            max_rounds=2,
-            temperature=0.7,
-            moderator_enabled=True,
-            data_files=[feedback_file]
-        )
-        
-        discussion = rt.discuss(
-            "Based on the customer feedback, what are the top 3 priorities?",
-            verbose=True
-        )
-        
-        if discussion.file_data:
-            print(f"\n✅ Success! Loaded {len(discussion.file_data)} file(s)")
-            for f in discussion.file_data:
-                print(f"   - {f['filename']}: {f['size']} characters")
-        else:
-            print("\n❌ Failed: No file data loaded")
+    discussion = rt.discuss(
+        "Based on the customer feedback, what are the top 3 priorities?",
+        verbose=True,
+        data_files=[feedback_file]
+    )
+    
+    if discussion.file_data:
+        print(f"\n✅ Success! Loaded {len(discussion.file_data)} file(s)")
+        for f in discussion.file_data:
+            print(f"   - {f['filename']}: {f['size']} characters")
+    else:
+        print("\n❌ Failed: No file data loaded")
 
 
-def test_directory():
+def run_directory(rt, data_dir):
     """Test with a directory of files."""
-    print("\n" + "="*80)
-    print("TEST 2: Directory of Files")
-    print("="*80)
+    _write_banner("TEST 2: Directory of Files")
     
-    try:
-        from roundtable import Roundtable
-    except ImportError:
-        print("❌ Error: Could not import roundtable. Make sure it's installed.")
-        return
+    print(f"\n📁 Testing with directory: {Path(data_dir).name}")
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        data_dir, _ = create_sample_files(tmpdir)
-        
-        print(f"\n📁 Testing with directory: {Path(data_dir).name}")
-        
-        rt = Roundtable(
-            max_rounds=2,
-            temperature=0.7,
-            moderator_enabled=True,
-            data_files=[data_dir]
-        )
-        
-        discussion = rt.discuss(
-            "What trends and patterns do you see across all the data files?",
-            verbose=True
-        )
-        
-        if discussion.file_data:
-            print(f"\n✅ Success! Loaded {len(discussion.file_data)} file(s)")
-            for f in discussion.file_data:
-                print(f"   - {f['filename']}: {f['size']} characters")
-        else:
-            print("\n❌ Failed: No file data loaded")
+    discussion = rt.discuss(
+        "What trends and patterns do you see across all the data files?",
+        verbose=True,
+        data_files=[data_dir]
+    )
+    
+    if discussion.file_data:
+        print(f"\n✅ Success! Loaded {len(discussion.file_data)} file(s)")
+        for f in discussion.file_data:
+            print(f"   - {f['filename']}: {f['size']} characters")
+    else:
+        print("\n❌ Failed: No file data loaded")
 
 
-def test_mixed():
+def run_mixed(rt, data_dir, feedback_file):
     """Test with both files and directories."""
-    print("\n" + "="*80)
-    print("TEST 3: Mixed Files and Directories")
-    print("="*80)
+    _write_banner("TEST 3: Mixed Files and Directories")
+    
+    print(f"\n📁 Testing with directory + file")
+    
+    discussion = rt.discuss(
+        "Synthesize insights from all available data sources.",
+        verbose=True,
+        data_files=[data_dir, feedback_file]
+    )
+    
+    if discussion.file_data:
+        print(f"\n✅ Success! Loaded {len(discussion.file_data)} file(s)")
+        total_chars = sum(f['size'] for f in discussion.file_data)
+        print(f"   Total content: {total_chars:,} characters")
+        for f in discussion.file_data:
+            print(f"   - {f['filename']}: {f['size']:,} characters")
+    else:
+        print("\n❌ Failed: No file data loaded")
+
+
+def main():
+    """Run all tests."""
+    _write_banner("🧪 Roundtable Data Files Feature Tests")
     
     try:
         from roundtable import Roundtable
@@ -145,49 +154,28 @@ def test_mixed():
         print("❌ Error: Could not import roundtable. Make sure it's installed.")
         return
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        data_dir, feedback_file = create_sample_files(tmpdir)
-        
-        print(f"\n📁 Testing with directory + file")
-        
+    try:
+        # Build the participants' clients once; the tests differ only in
+        # which files they hand to discuss()
         rt = Roundtable(
             max_rounds=2,
             temperature=0.7,
-            moderator_enabled=True,
-            data_files=[data_dir, feedback_file]
+            moderator_enabled=True
         )
         
-        discussion = rt.discuss(
-            "Synthesize insights from all available data sources.",
-            verbose=True
-        )
+        # All three tests read the same files, so write them once
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_dir, feedback_file = create_sample_files(tmpdir)
+            
+            run_single_file(rt, feedback_file)
+            run_directory(rt, data_dir)
+            run_mixed(rt, data_dir, feedback_file)
         
-        if discussion.file_data:
-            print(f"\n✅ Success! Loaded {len(discussion.file_data)} file(s)")
-            total_chars = sum(f['size'] for f in discussion.file_data)
-            print(f"   Total content: {total_chars:,} characters")
-            for f in discussion.file_data:
-                print(f"   - {f['filename']}: {f['size']:,} characters")
-        else:
-            print("\n❌ Failed: No file data loaded")
-
-
-def main():
-    """Run all tests."""
-    print("\n" + "="*80)
-    print("🧪 Roundtable Data Files Feature Tests")
-    print("="*80)
-    
-    try:
-        test_single_file()
-        test_directory()
-        test_mixed()
-        
-        print("\n" + "="*80)
-        print("✅ All tests completed!")
-        print("="*80)
-        print("\nNote: These tests require configured AI models in .env")
-        print("See README.md for configuration instructions.")
+        _write_banner(
+            "✅ All tests completed!",
+            "\nNote: These tests require configured AI models in .env\n"
+            "See README.md for configuration instructions.\n"
+        )
         
     except Exception as e:
         print(f"\n❌ Error: {e}")
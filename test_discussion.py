@@ -7,16 +7,16 @@ from pathlib import Path
 # Add to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+RULE = "=" * 80
+
 try:
     from roundtable import Roundtable
     
-    print("=" * 80)
-    print("ROUNDTABLE DISCUSSION TEST")
-    print("=" * 80)
-    print()
+    sys.stdout.write(f"{RULE}\nROUNDTABLE DISCUSSION TEST\n{RULE}\n\n")
     
     # Initialize
-    print("Initializing roundtable...")
+    sys.stdout.write("Initializing roundtable...\n")
+    sys.stdout.flush()
     rt = Roundtable(
         max_rounds=4,
         temperature=0.9,
@@ -24,19 +24,17 @@ try:
         tools_enabled=False,
     )
     
-    print(f"✓ {len(rt.participants)} participants loaded")
-    print()
+    sys.stdout.write(f"✓ {len(rt.participants)} participants loaded\n\n")
+    sys.stdout.flush()
     
     # Discuss
     discussion = rt.discuss("What's the meaning of life?", verbose=True)
     
-    print()
-    print("=" * 80)
-    print("DISCUSSION COMPLETE")
-    print("=" * 80)
+    sys.stdout.write(f"\n{RULE}\nDISCUSSION COMPLETE\n{RULE}\n")
     
 except Exception as e:
-    print(f"ERROR: {e}")
+    sys.stdout.write(f"ERROR: {e}\n")
+    sys.stdout.flush()
     import traceback
     traceback.print_exc()
     sys.exit(1)
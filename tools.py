@@ -7,66 +7,179 @@ Provides access to:
 - Academic papers (arXiv)
 """
 
+import asyncio
+import itertools
 import os
-from typing import List
+import sys
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional
 from langchain_core.tools import Tool
 
 try:
     import wikipedia
+    _WikiDisambig = wikipedia.exceptions.DisambiguationError
+    _WikiPage = wikipedia.exceptions.PageError
 except ImportError:
     wikipedia = None
+    _WikiDisambig = _WikiPage = None
 
 try:
     import arxiv
 except ImportError:
     arxiv = None
 
+# One client for the whole session so its HTTP connection is reused. A single
+# small page per search; the default client pulls 100 entries per request.
+_ARXIV_CLIENT = arxiv.Client(page_size=3, num_retries=2) if arxiv else None
+
 try:
     from tavily import TavilyClient
 except ImportError:
     TavilyClient = None
 
+try:
+    from tavily import AsyncTavilyClient
+except ImportError:
+    # Older tavily-python releases only ship the sync client
+    AsyncTavilyClient = None
 
-# --- Tavily Web Search Tool ---
-def _create_tavily_tool() -> Tool:
-    """Create Tavily search tool if API key is configured."""
-    api_key = os.getenv('TAVILY_API_KEY')
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+
+# --- Tool descriptions (shown to participants in the system prompt) ---
+_TAVILY_DESC = (
+    "Search the web for current information and recent news. "
+    "Use for up-to-date facts, current events, and real-time data. "
+    "Input: search query (str)"
+)
+_WIKIPEDIA_DESC = (
+    "Get information from Wikipedia for general knowledge topics, "
+    "historical facts, and biographical information. "
+    "Input: topic or person name (str)"
+)
+_ARXIV_DESC = (
+    "Search for academic papers and research on arXiv. "
+    "Use for scientific research, technical papers, and cutting-edge findings. "
+    "Input: research topic or query (str)"
+)
+
+
+# --- Result cache ---
+TOOL_CACHE_DIR = Path.home() / ".cache" / "roundtable" / "tools"
+TOOL_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+
+@lru_cache(maxsize=1)
+def _get_tool_cache():
+    """Open the on-disk tool result cache, or None if it is unavailable."""
+    if not diskcache:
+        return None
+    try:
+        return diskcache.Cache(str(TOOL_CACHE_DIR))
+    except Exception as e:
+        # An unwritable cache dir shouldn't take the tools down with it
+        print(f"⚠️ Tool result cache disabled: {e}")
+        return None
+
+
+def _cache_key(tool_name: str, query: str, *extra: str) -> tuple:
+    """
+    Build a cache key for a tool query.
     
+    The query is used verbatim: results embed it, and Wikipedia titles are
+    case-sensitive, so folding case would merge distinct lookups.
+    """
+    return (tool_name, query, *extra)
+
+
+def _cache_get(key: tuple) -> Optional[str]:
+    """Look up a cached tool result, treating any cache error as a miss."""
+    cache = _get_tool_cache()
+    if cache is None:
+        return None
+    try:
+        return cache.get(key)
+    except Exception:
+        return None
+
+
+def _cache_set(key: tuple, value: str) -> str:
+    """Store a successful tool result (if the cache allows) and return it."""
+    cache = _get_tool_cache()
+    if cache is not None:
+        try:
+            cache.set(key, value, expire=TOOL_CACHE_TTL_SECONDS)
+        except Exception:
+            pass
+    return value
+
+
+# --- Tavily Web Search Tool ---
+@lru_cache(maxsize=1)
+def _create_tavily_tool(api_key: Optional[str]) -> Tool:
+    """Create Tavily search tool if API key is configured (once per key)."""
     if not api_key or not TavilyClient:
         return None
     
     tavily_client = TavilyClient(api_key=api_key)
+    async_client = AsyncTavilyClient(api_key=api_key) if AsyncTavilyClient else None
+    
+    def format_results(query: str, results: dict) -> str:
+        if not results.get("results"):
+            return f"No results found for: {query}"
+        
+        # Format results
+        return "\n".join(
+            line
+            for r in results["results"]
+            for line in (
+                f"• {r.get('title', 'No title')}",
+                f"  {r.get('content', 'No content')}",
+                f"  Source: {r.get('url', 'No URL')}",
+            )
+        )
     
     def tavily_search(query: str) -> str:
         """Search the web using Tavily AI search engine."""
+        key = _cache_key("tavily_search", query)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
         try:
             results = tavily_client.search(query=query, search_depth="basic")
-            if not results.get("results"):
-                return f"No results found for: {query}"
-            
-            # Format results
-            output = []
-            for r in results.get("results", []):
-                output.append(f"• {r.get('title', 'No title')}")
-                output.append(f"  {r.get('content', 'No content')}")
-                output.append(f"  Source: {r.get('url', 'No URL')}")
-            
-            return "\n".join(output)
+            return _cache_set(key, format_results(query, results))
         except Exception as e:
-            return f"Tavily search error: {str(e)}"
+            return f"Tavily search error: {e}"
+    
+    async def atavily_search(query: str) -> str:
+        """Search the web using Tavily without blocking the event loop."""
+        if async_client is None:
+            return await asyncio.to_thread(tavily_search, query)
+        key = _cache_key("tavily_search", query)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+        try:
+            results = await async_client.search(query=query, search_depth="basic")
+            return _cache_set(key, format_results(query, results))
+        except Exception as e:
+            return f"Tavily search error: {e}"
     
     return Tool(
         name="tavily_search",
         func=tavily_search,
-        description=(
-            "Search the web for current information and recent news. "
-            "Use for up-to-date facts, current events, and real-time data. "
-            "Input: search query (str)"
-        )
+        coroutine=atavily_search,
+        description=_TAVILY_DESC,
     )
 
 
 # --- Wikipedia Tool ---
+@lru_cache(maxsize=1)
 def _create_wikipedia_tool() -> Tool:
     """Create Wikipedia search tool if library is installed."""
     if not wikipedia:
@@ -74,28 +187,39 @@ def _create_wikipedia_tool() -> Tool:
     
     def wikipedia_search(query: str) -> str:
         """Get a summary of a topic from Wikipedia."""
+        key = _cache_key("wikipedia_search", query)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
         try:
-            summary = wikipedia.summary(query, sentences=5)
-            return f"Wikipedia Summary for '{query}':\n\n{summary}"
-        except wikipedia.exceptions.DisambiguationError as e:
+            try:
+                # Exact titles resolve without the extra suggestion search
+                summary = wikipedia.summary(query, sentences=5, auto_suggest=False)
+            except _WikiPage:
+                summary = wikipedia.summary(query, sentences=5, auto_suggest=True)
+            return _cache_set(key, f"Wikipedia Summary for '{query}':\n\n{summary}")
+        except _WikiDisambig as e:
             return f"Disambiguation needed for '{query}'. Options: {', '.join(e.options[:5])}"
-        except wikipedia.exceptions.PageError:
+        except _WikiPage:
             return f"Wikipedia page not found for: {query}"
         except Exception as e:
-            return f"Wikipedia search error: {str(e)}"
+            return f"Wikipedia search error: {e}"
+    
+    async def awikipedia_search(query: str) -> str:
+        """Get a Wikipedia summary without blocking the event loop."""
+        # The wikipedia library is sync-only, so run it on a worker thread
+        return await asyncio.to_thread(wikipedia_search, query)
     
     return Tool(
         name="wikipedia_search",
         func=wikipedia_search,
-        description=(
-            "Get information from Wikipedia for general knowledge topics, "
-            "historical facts, and biographical information. "
-            "Input: topic or person name (str)"
-        )
+        coroutine=awikipedia_search,
+        description=_WIKIPEDIA_DESC,
     )
 
 
 # --- ArXiv Academic Papers Tool ---
+@lru_cache(maxsize=1)
 def _create_arxiv_tool() -> Tool:
     """Create arXiv search tool if library is installed."""
     if not arxiv:
@@ -103,6 +227,11 @@ def _create_arxiv_tool() -> Tool:
     
     def arxiv_search(query: str) -> str:
         """Search for academic papers on arXiv."""
+        # Results are sorted by submission date, so they go stale daily
+        key = _cache_key("arxiv_search", query, date.today().isoformat())
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
         try:
             search = arxiv.Search(
                 query=query,
@@ -111,31 +240,37 @@ def _create_arxiv_tool() -> Tool:
                 sort_order=arxiv.SortOrder.Descending,
             )
             
-            papers = list(search.results())
+            papers = list(itertools.islice(_ARXIV_CLIENT.results(search), 3))
             
             if not papers:
-                return f"No papers found on arXiv for: {query}"
+                return _cache_set(key, f"No papers found on arXiv for: {query}")
             
-            output = []
-            for i, paper in enumerate(papers, 1):
-                output.append(f"\n{i}. {paper.title}")
-                output.append(f"   Authors: {', '.join([a.name for a in paper.authors[:3]])}")
-                output.append(f"   Published: {paper.published.strftime('%Y-%m-%d')}")
-                output.append(f"   Summary: {paper.summary[:300]}...")
-                output.append(f"   URL: {paper.pdf_url}")
+            output = "\n".join(
+                line
+                for i, paper in enumerate(papers, 1)
+                for line in (
+                    f"\n{i}. {paper.title}",
+                    f"   Authors: {', '.join(a.name for a in paper.authors[:3])}",
+                    f"   Published: {paper.published.date().isoformat()}",
+                    f"   Summary: {paper.summary[:300]}...",
+                    f"   URL: {paper.pdf_url}",
+                )
+            )
             
-            return "\n".join(output)
+            return _cache_set(key, output)
         except Exception as e:
-            return f"ArXiv search error: {str(e)}"
+            return f"ArXiv search error: {e}"
+    
+    async def aarxiv_search(query: str) -> str:
+        """Search arXiv without blocking the event loop."""
+        # The arxiv client is sync-only, so run it on a worker thread
+        return await asyncio.to_thread(arxiv_search, query)
     
     return Tool(
         name="arxiv_search",
         func=arxiv_search,
-        description=(
-            "Search for academic papers and research on arXiv. "
-            "Use for scientific research, technical papers, and cutting-edge findings. "
-            "Input: research topic or query (str)"
-        )
+        coroutine=aarxiv_search,
+        description=_ARXIV_DESC,
     )
 
 
@@ -143,13 +278,16 @@ def get_available_tools() -> List[Tool]:
     """
     Get all available external tools.
     
+    Each tool is built once and reused; the Tavily tool is keyed on the
+    current TAVILY_API_KEY so a rotated key still takes effect.
+    
     Returns:
         List of Tool objects for use in roundtable
     """
     tools = []
     
     # Try to create each tool
-    tavily = _create_tavily_tool()
+    tavily = _create_tavily_tool(os.getenv('TAVILY_API_KEY'))
     if tavily:
         tools.append(tavily)
     
@@ -164,36 +302,47 @@ def get_available_tools() -> List[Tool]:
     return tools
 
 
+def __getattr__(name):
+    """Build AVAILABLE_TOOLS on first access rather than at import (PEP 562)."""
+    if name == "AVAILABLE_TOOLS":
+        global AVAILABLE_TOOLS
+        AVAILABLE_TOOLS = get_available_tools()
+        return AVAILABLE_TOOLS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def print_tools_status():
-    """Print status of available tools."""
-    print("\n📚 Available Tools Status:\n")
+    """Print status of available tools (plain ASCII markers when piped)."""
+    fancy = sys.stdout.isatty()
+    ok = "✅" if fancy else "[OK]"
+    bad = "❌" if fancy else "[--]"
+    header = "📚 Available Tools Status:" if fancy else "Available Tools Status:"
+    lines = ["", header, ""]
     
     # Tavily
     if TavilyClient and os.getenv('TAVILY_API_KEY'):
-        print("✅ Tavily Web Search - AVAILABLE")
+        lines.append(f"{ok} Tavily Web Search - AVAILABLE")
     else:
-        print("❌ Tavily Web Search - NOT CONFIGURED")
+        lines.append(f"{bad} Tavily Web Search - NOT CONFIGURED")
         if not TavilyClient:
-            print("   (Install: pip install tavily-python)")
+            lines.append("   (Install: pip install tavily-python)")
         else:
-            print("   (Set TAVILY_API_KEY in .env)")
+            lines.append("   (Set TAVILY_API_KEY in .env)")
     
     # Wikipedia
     if wikipedia:
-        print("✅ Wikipedia Search - AVAILABLE")
+        lines.append(f"{ok} Wikipedia Search - AVAILABLE")
     else:
-        print("❌ Wikipedia Search - NOT INSTALLED")
-        print("   (Install: pip install wikipedia-api)")
+        lines.append(f"{bad} Wikipedia Search - NOT INSTALLED")
+        lines.append("   (Install: pip install wikipedia-api)")
     
     # ArXiv
     if arxiv:
-        print("✅ ArXiv Search - AVAILABLE")
+        lines.append(f"{ok} ArXiv Search - AVAILABLE")
     else:
-        print("❌ ArXiv Search - NOT INSTALLED")
-        print("   (Install: pip install arxiv)")
+        lines.append(f"{bad} ArXiv Search - NOT INSTALLED")
+        lines.append("   (Install: pip install arxiv)")
     
-    print()
-
+    lines.append("")
+    print("\n".join(lines))
 
-# Pre-create all available tools
-AVAILABLE_TOOLS = get_available_tools()